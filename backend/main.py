@@ -1,7 +1,7 @@
 from io import BytesIO
 from typing import Annotated
 from fastapi import Depends, FastAPI, Form, HTTPException, UploadFile, File
-from pipeline import pipeline_crime_hotspot
+from pipeline import pipeline_crime_hotspot, pipeline_crime_hotspot_batch
 from dependencies import get_models
 import pandas as pd
 from fastapi.middleware.cors import CORSMiddleware
@@ -20,18 +20,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
     
-@app.post("/forecast")
-async def forecast(
-    city: Annotated[str, Form(...)],
-    days: Annotated[int, Form(...)],
-    file: Annotated[UploadFile, File(...)],
-    models=Depends(get_models),
-):
-    city_models = models.get(city.lower(), None)
-    
-    if not city_models:
-        raise HTTPException(status_code=400, detail=f"Não há modelos treinados para a cidade: {city}")
-    
+async def read_crime_file(file: UploadFile) -> pd.DataFrame:
     if file is None:
         raise HTTPException(status_code=400, detail="Envie um arquivo .csv ou .xlsx")
     
@@ -61,9 +50,64 @@ async def forecast(
     
     if df["data_ocorrencia"].isnull().all():
         raise HTTPException(status_code=400, detail="A coluna 'data_ocorrencia' deve conter datas válidas.")
+    
+    return df
+
+@app.post("/forecast")
+async def forecast(
+    city: Annotated[str, Form(...)],
+    days: Annotated[int, Form(...)],
+    file: Annotated[UploadFile, File(...)],
+    models=Depends(get_models),
+):
+    city_models = models.get(city.lower(), None)
+    
+    if not city_models:
+        raise HTTPException(status_code=400, detail=f"Não há modelos treinados para a cidade: {city}")
+    
+    df = await read_crime_file(file)
+    
     try:
         forecast = pipeline_crime_hotspot(df=df, days=days, models=city_models)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erro ao processar a previsão: {str(e)}")
     
-    return {"forecast": forecast}
\ No newline at end of file
+    return {"forecast": forecast}
+
+@app.post("/forecast/batch")
+async def forecast_batch(
+    city: Annotated[list[str], Form(...)],
+    days: Annotated[list[int], Form(...)],
+    file: Annotated[UploadFile, File(...)],
+    models=Depends(get_models),
+):
+    if len(city) != len(days):
+        raise HTTPException(status_code=400, detail="Envie o mesmo número de valores para 'city' e 'days'.")
+    
+    if any(horizon <= 0 for horizon in days):
+        raise HTTPException(status_code=400, detail="O campo 'days' deve conter apenas valores positivos.")
+    
+    # Agrupa os horizontes por cidade para clusterizar e ajustar os modelos uma única vez
+    horizons_by_city: dict[str, list[int]] = {}
+    for city_name, horizon in zip(city, days):
+        if not models.get(city_name.lower(), None):
+            raise HTTPException(status_code=400, detail=f"Não há modelos treinados para a cidade: {city_name}")
+        horizons_by_city.setdefault(city_name.lower(), []).append(horizon)
+    
+    df = await read_crime_file(file)
+    
+    forecasts_by_city = {}
+    for city_name, horizons in horizons_by_city.items():
+        try:
+            forecasts_by_city[city_name] = pipeline_crime_hotspot_batch(
+                df=df.copy(), horizons=horizons, models=models[city_name]
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Erro ao processar a previsão: {str(e)}")
+    
+    return {
+        "forecasts": [
+            {"city": city_name, "days": horizon, "forecast": forecasts_by_city[city_name.lower()][horizon]}
+            for city_name, horizon in zip(city, days)
+        ]
+    }
\ No newline at end of file
@@ -9,12 +9,19 @@ def pipeline_crime_hotspot(df: pd.DataFrame, days: int, models):
     identifies hotspot clusters, and performs time series forecasting
     for each detected hotspot using pre-trained models.
 
+    If the city has a global model (key "global"), every hotspot is forecasted
+    at once by that model instead of fitting one model per hotspot. The two
+    modes do not forecast the same quantity: the global model predicts the
+    expected crimes per calendar day (days without crimes count as 0), while
+    the per-hotspot models are fitted only on the days that had crimes.
+
     Args:
         df (pd.DataFrame): Input DataFrame containing crime records. Must include
             'latitude', 'longitude', and 'data_ocorrencia' columns.
         days (int): Number of future days to forecast.
         models (dict): Dictionary containing trained models for HDBSCAN clustering
-            and time series forecasting. Must include a key "hdbscan" for the clusterer.
+            and time series forecasting. Must include a key "hdbscan" for the clusterer
+            and either one model per hotspot or a single "global" model.
 
     Returns:
         list[dict]: A list of forecast results, where each entry represents
@@ -41,6 +48,17 @@ def pipeline_crime_hotspot(df: pd.DataFrame, days: int, models):
     ]
     print(hotspot_ids)
 
+    global_model = models.get("global", None)
+    if global_model:
+        filtered_df = df[df["hotspot_id"].notna() & (df["hotspot_id"] != -1)]
+        if filtered_df.empty:
+            print("No data available for the detected hotspots, skipping forecast.")
+            return []
+
+        forecast = pipeline_global_forecast(days=days, df=filtered_df, model=global_model)
+
+        return forecast.to_dict(orient="records")
+
     selected_models = [
         {hotspot: model} for hotspot, model in models.items() if hotspot in hotspot_ids
     ]
@@ -69,6 +87,40 @@ def pipeline_crime_hotspot(df: pd.DataFrame, days: int, models):
     return forecasts
 
 
+def pipeline_crime_hotspot_batch(df: pd.DataFrame, horizons: list[int], models):
+    """Runs the hotspot forecasting pipeline once for several horizons.
+
+    The clustering and the forecasting models run a single time at the longest
+    horizon, and the shorter horizons are sliced from that forecast, since
+    their steps are the first steps of the longest one.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame containing crime records. Must include
+            'latitude', 'longitude', and 'data_ocorrencia' columns.
+        horizons (list[int]): Numbers of future days to forecast.
+        models (dict): Dictionary containing trained models of the city, as
+            expected by `pipeline_crime_hotspot`.
+
+    Returns:
+        dict[int, list[dict]]: Forecast results of `pipeline_crime_hotspot`
+            keyed by horizon.
+
+    Example:
+        >>> forecasts = pipeline_crime_hotspot_batch(df, horizons=[7, 30], models=models)
+        >>> len(forecasts[7]) < len(forecasts[30])
+        True
+    """
+    forecasts = pipeline_crime_hotspot(df=df, days=max(horizons), models=models)
+
+    if not forecasts:
+        return {days: [] for days in horizons}
+
+    fcst = pd.DataFrame(forecasts)
+    step = fcst.groupby("hotspot_id", sort=False).cumcount()
+
+    return {days: fcst[step < days].to_dict(orient="records") for days in horizons}
+
+
 def pipeline_forecast(days: int, hotspot_id: float, df: pd.DataFrame, model):
     """Generates crime forecasts for a specific hotspot.
 
@@ -125,6 +177,105 @@ def pipeline_forecast(days: int, hotspot_id: float, df: pd.DataFrame, model):
 
     return fcst
 
+def pipeline_global_forecast(days: int, df: pd.DataFrame, model: dict):
+    """Generates crime forecasts for all hotspots with a single global model.
+
+    The global model is trained across every hotspot series of a city using
+    the hotspot identity and calendar features, so the forecast horizon of
+    all hotspots is predicted in one vectorized call per output column.
+
+    The training series have one row per calendar day, with 0 on days without
+    crimes, so the forecasts are expected crimes per calendar day. Hotspots
+    unknown to the model are skipped.
+
+    Args:
+        days (int): Number of future days to forecast.
+        df (pd.DataFrame): DataFrame containing historical crime data labeled with
+            'hotspot_id'. Must include 'data_ocorrencia', 'latitude' and 'longitude' columns.
+        model (dict): Global model artifact with the keys:
+            - 'hotspot_codes': Mapping of the hotspot IDs seen during training
+              to the codes (0 to n-1) used as the hotspot identity feature.
+            - 'features': Ordered feature names expected by the estimators.
+            - 'models': Estimators keyed by output column
+              ('mean_crimes', 'min_crimes', 'max_crimes').
+
+    Returns:
+        pd.DataFrame: Forecast results with the same columns as `pipeline_forecast`.
+
+    Example:
+        >>> result = pipeline_global_forecast(7, df_hotspots, global_model)
+        >>> result.head()
+                ds  mean_crimes  min_crimes  max_crimes  latitude  longitude  hotspot_id
+        0  2025-10-10        12.4         9.2        15.8 -23.5596  -46.6357         1.0
+    """
+    columns = ["ds", "mean_crimes", "min_crimes", "max_crimes", "hotspot_id", "latitude", "longitude"]
+
+    df = df[df["hotspot_id"].isin(list(model["hotspot_codes"]))]
+    if df.empty:
+        print("No data available for the hotspots known by the global model, skipping forecast.")
+        return pd.DataFrame(columns=columns)
+
+    hotspots = df.groupby("hotspot_id").agg(
+        last_ds=("data_ocorrencia", "max"),
+        latitude=("latitude", "mean"),
+        longitude=("longitude", "mean"),
+    )
+
+    # One row per (hotspot, future day), starting after each hotspot's last observation
+    steps = np.arange(1, days + 1)
+    fcst = hotspots.loc[hotspots.index.repeat(days)].reset_index()
+    fcst["ds"] = fcst["last_ds"] + pd.to_timedelta(np.tile(steps, len(hotspots)), unit="D")
+
+    features = make_global_features(
+        hotspot_code=fcst["hotspot_id"].map(model["hotspot_codes"]), ds=fcst["ds"]
+    )[model["features"]]
+
+    for column, estimator in model["models"].items():
+        fcst[column] = estimator.predict(features)
+
+    # The quantile models are fitted independently, so keep the interval
+    # around the mean and the crime counts non-negative
+    fcst["mean_crimes"] = fcst["mean_crimes"].clip(lower=0)
+    fcst["min_crimes"] = np.minimum(fcst["min_crimes"].clip(lower=0), fcst["mean_crimes"])
+    fcst["max_crimes"] = np.maximum(fcst["max_crimes"], fcst["mean_crimes"])
+
+    fcst = fcst[columns]
+
+    fcst = fcst.replace([np.inf, -np.inf], np.nan).fillna(0)
+
+    return fcst
+
+
+def make_global_features(hotspot_code: pd.Series, ds: pd.Series):
+    """Builds the hotspot identity and calendar features of the global model.
+
+    Args:
+        hotspot_code (pd.Series): Code of the hotspot of each row, as stored in
+            the 'hotspot_codes' mapping of the global model artifact.
+        ds (pd.Series): Date of each row.
+
+    Returns:
+        pd.DataFrame: Feature matrix with the columns 'hotspot_code', 'dayofweek',
+            'day', 'month' and 'dayofyear'.
+
+    Example:
+        >>> codes = ts["hotspot_id"].map(global_model["hotspot_codes"])
+        >>> make_global_features(codes, ts["ds"]).head(1)
+           hotspot_code  dayofweek  day  month  dayofyear
+        0             1          4   10     10        283
+    """
+    ds = pd.to_datetime(ds)
+
+    return pd.DataFrame(
+        {
+            "hotspot_code": hotspot_code.astype(int).to_numpy(),
+            "dayofweek": ds.dt.dayofweek.to_numpy(),
+            "day": ds.dt.day.to_numpy(),
+            "month": ds.dt.month.to_numpy(),
+            "dayofyear": ds.dt.dayofyear.to_numpy(),
+        }
+    )
+
 def pipeline_clusterer(df: pd.DataFrame, model):
     """Assigns hotspot cluster IDs to crime data using HDBSCAN.
 
@@ -2,18 +2,27 @@ from pathlib import Path
 import pickle
 from statsforecast import StatsForecast
 
+GLOBAL_MODEL_FILENAME = "global_forecast.pkl"
+
 def load_models(models_path: Path):
     models = {}
     for model_dir in models_path.iterdir():
         if model_dir.is_dir():
             dir_name = model_dir.name
             models[dir_name] = {}
+            # A global model replaces the per-hotspot models of the city
+            use_global = (model_dir / GLOBAL_MODEL_FILENAME).is_file()
             for model_file in model_dir.iterdir():
                 if not model_file.is_file() and model_file.suffix != ".pkl":
                     continue
+                if use_global and model_file.name.endswith("_statsforecast.pkl"):
+                    continue
                 filename = model_file.name.lower().split(".")[0]
                 model_name = filename.split("_")[0]
                 with open(model_file, "rb") as f:
                     models[dir_name][model_name] = pickle.load(f)
+    for city, city_models in models.items():
+        mode = "global" if "global" in city_models else "per-hotspot"
+        print(f"Serving {city} with {mode} forecasting models")
     print("Loaded all machine learning models")
     return models
\ No newline at end of file